@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config.settings import settings
 from app.utils.logging import get_logger
@@ -27,7 +28,10 @@ async def lifespan(_: FastAPI):
 def create_application() -> FastAPI:
     """Initialize the FastAPI application with settings and lifespan events."""
     application = FastAPI(
-        title=settings.NAME, version=settings.VERSION, lifespan=lifespan
+        title=settings.NAME,
+        version=settings.VERSION,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Setup error handlers
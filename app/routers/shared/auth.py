@@ -1,6 +1,7 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, Request
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.db.models import User
@@ -14,16 +15,21 @@ from app.utils.errors import AuthenticationError
 
 auth_router = APIRouter()
 
+_ACTIVE_USER_BY_ID_STMT = select(User).where(
+    User.id == bindparam("user_id"), User.is_active == True
+)
+_USER_ADAPTER = TypeAdapter(UserResponse)
+
 
 @auth_router.get("/me")
-async def get_current_user_info(
+def get_current_user_info(
     request: Request,
     current_user: Annotated[AuthState, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_sync_session)],
 ):
     """Get current authenticated user information"""
     user = db.execute(
-        select(User).where(User.id == current_user.user_id, User.is_active == True)
+        _ACTIVE_USER_BY_ID_STMT, {"user_id": current_user.user_id}
     ).scalar_one_or_none()
 
     if not user:
@@ -40,6 +46,6 @@ async def get_current_user_info(
 
     return ResponseBuilder.success(
         request=request,
-        data=user_data.model_dump(by_alias=True),
+        data=_USER_ADAPTER.dump_python(user_data, by_alias=True),
         message="User information retrieved",
     )
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, Request, status
+from pydantic import TypeAdapter
 from httpcore import request
 
 from app.schemas.staff.member_schemas import (
@@ -16,6 +17,9 @@ from app.middlewares.auth_middleware import require_staff
 
 members_router = APIRouter(dependencies=[Depends(require_staff)])
 
+_MEMBER_ADAPTER = TypeAdapter(StaffMemberItem)
+_MEMBERS_ADAPTER = TypeAdapter(list[StaffMemberItem])
+
 
 # API Endpoints
 @members_router.get(
@@ -29,14 +33,17 @@ async def get_all_members(request: Request, member_service=Depends(get_member_se
     """Get all staff members"""
     try:
         members = await member_service.get_all_members_with_count()
+        serialized = _MEMBERS_ADAPTER.dump_python(members, by_alias=True)
+        total_count = len(serialized)
+        suffix = "" if total_count == 1 else "s"
 
         return ResponseBuilder.success(
             request=request,
             data={
-                "members": [member.model_dump(by_alias=True) for member in members],
-                "total_count": len(members),
+                "members": serialized,
+                "total_count": total_count,
             },
-            message=f"Retrieved {len(members)} staff member{'s' if len(members) != 1 else ''}",
+            message=f"Retrieved {total_count} staff member{suffix}",
             status_code=status.HTTP_200_OK,
         )
 
@@ -63,7 +70,7 @@ async def create_staff_member(
         data = await member_service.create_member(member_data)
         return ResponseBuilder.success(
             request=request,
-            data=data.model_dump(by_alias=True),
+            data=_MEMBER_ADAPTER.dump_python(data, by_alias=True),
             message="Staff member created successfully",
             status_code=status.HTTP_201_CREATED,
         )
@@ -91,7 +98,7 @@ async def update_staff_member(
         data = await member_service.update_member(staff_id, member_data)
         return ResponseBuilder.success(
             request=request,
-            data=data.model_dump(by_alias=True),
+            data=_MEMBER_ADAPTER.dump_python(data, by_alias=True),
             message="Staff member updated successfully",
             status_code=status.HTTP_200_OK,
         )
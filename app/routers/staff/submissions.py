@@ -158,7 +158,7 @@ async def verify_submission(
             1 if verification_data.status == "approved" else 0
         )
 
-        await dashboard_stats_service.update_dashboard_stats_by_schedule(
+        dashboard_stats_service.update_dashboard_stats_by_schedule(
             requirement_schedule_id=str(verification_data.schedule_id),
             manual_verification_increment=manual_verification_increment,
         )
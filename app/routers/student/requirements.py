@@ -64,7 +64,7 @@ async def submit_student_certificate(
         )
 
         # Update dashboard stats
-        await dashboard_stats_service.update_dashboard_stats_by_schedule(
+        dashboard_stats_service.update_dashboard_stats_by_schedule(
             requirement_schedule_id=to_str(submission_response.schedule_id)
         )
 
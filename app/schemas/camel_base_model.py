@@ -1,9 +1,13 @@
 import uuid
 from datetime import datetime, date
 from enum import Enum
+from functools import lru_cache
 from pydantic import BaseModel, ConfigDict, field_serializer
 from pydantic.alias_generators import to_camel
 
+# Field names like id, created_at or is_active repeat across most schemas
+_to_camel = lru_cache(maxsize=2048)(to_camel)
+
 
 class CamelCaseBaseModel(BaseModel):
     """
@@ -20,7 +24,7 @@ class CamelCaseBaseModel(BaseModel):
     """
 
     model_config = ConfigDict(
-        alias_generator=to_camel,
+        alias_generator=_to_camel,
         populate_by_name=True,
     )
 
@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from app.schemas.camel_base_model import CamelCaseBaseModel as BaseModel
 
@@ -8,6 +8,8 @@ from app.schemas.camel_base_model import CamelCaseBaseModel as BaseModel
 class DashboardStatsResponse(BaseModel):
     """Response schema for dashboard statistics."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str | UUID = Field(..., description="Unique identifier for the stats record")
     requirement_schedule_id: str | UUID = Field(
         ..., description="Requirement schedule ID"
@@ -1,15 +1,27 @@
 import re
+import uuid
+import asyncio
+import calendar
 import instructor
-from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Any, cast
-from sqlalchemy import select
+from httpx import AsyncClient, Cookies, HTTPError, HTTPStatusError
+from sqlalchemy import select, update
+from sqlalchemy.orm import load_only
 from pydantic import ValidationError
-from playwright.async_api import async_playwright, Error as PlaywrightError
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Playwright,
+    Error as PlaywrightError,
+)
 
 
 from app.utils.logging import get_logger
 from app.config.settings import settings
-from app.services.minio_service import MinIOService
+from app.services.minio_service import get_minio_service
 from app.services.document_service import get_document_service
 from app.db.models import (
     CertificateSubmission,
@@ -37,6 +49,52 @@ from app.db.session import get_sync_session
 
 logger = get_logger()
 
+_VERIFY_URL_RE = re.compile(
+    r"^(?:https://)?www\.citiprogram\.org/verify/\?w(.+)-(\d{8})$",
+    re.IGNORECASE,
+)
+_URL_SCHEME_RE = re.compile(r"^https://", re.IGNORECASE)
+_CITI_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+_PARENS_RE = re.compile(r"\([^)]*\)")
+_SPACE_TBL = str.maketrans("", "", " ")
+_CROSS_CHECK_FIELDS = tuple(
+    f for f in CitiCertificateStructuredOutput.model_fields if f != "generated_on"
+)
+_get_cross_check_values = attrgetter(*_CROSS_CHECK_FIELDS)
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+def _is_uuid(value: str) -> bool:
+    """Check for a canonical hyphenated UUID, e.g. the token in a verify URL."""
+    # uuid.UUID also accepts braces, "urn:uuid:" and stray hyphens, so only
+    # a value that round-trips unchanged is canonical
+    try:
+        return str(uuid.UUID(value)) == value.lower()
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _get_llm_client():
+    """Build the instructor client once and share it across service instances."""
+    return instructor.from_provider(
+        model=settings.OLLAMA_MODEL,
+        base_url=settings.OLLAMA_BASE_URL,
+    )
+
 
 class CitiCertVerificationService:
     """
@@ -44,11 +102,8 @@ class CitiCertVerificationService:
     """
 
     def __init__(self):
-        self.minio_service = MinIOService()
-        self.llm_client = instructor.from_provider(
-            model=settings.OLLAMA_MODEL,
-            base_url=settings.OLLAMA_BASE_URL,
-        )
+        self.minio_service = get_minio_service()
+        self.llm_client = _get_llm_client()
         self.decision_mapping = {
             VerificationDecision.APPROVE: SubmissionStatus.APPROVED,
             VerificationDecision.REJECT: SubmissionStatus.REJECTED,
@@ -99,27 +154,31 @@ class CitiCertVerificationService:
                 return
 
             # Download certificate from CITI Program URL for cross-check
+            # The extracted URL may or may not carry a scheme; add exactly one
+            verification_url = _URL_SCHEME_RE.sub(
+                "", structured_output.verification_url, count=1
+            )
             certificate_data = await download_certificate_from_url(
-                f"https://{structured_output.verification_url}"
+                f"https://{verification_url}"
             )
-            upload_result = await self.minio_service.upload_bytes(
-                data=cast(bytes, certificate_data),
-                filename=submission.filename,
-                prefix="citi-automated-docs",
-                content_type="application/pdf",
+
+            # Archive the downloaded certificate while cross-checking its text
+            upload_result, miss_matches = await asyncio.gather(
+                self.minio_service.upload_bytes(
+                    data=cast(bytes, certificate_data),
+                    filename=submission.filename,
+                    prefix="citi-automated-docs",
+                    content_type="application/pdf",
+                ),
+                self._extract_and_cross_check(
+                    structured_output, submission.filename, certificate_data
+                ),
             )
             if not upload_result["success"]:
                 logger.warning(
                     f"Failed to upload downloaded certificate for cross-check. Continuing verification."
                 )
-            cross_check_extraction = await self._extract_document_text(
-                submission.filename, certificate_data  # type: ignore
-            )
 
-            # Cross-check extracted text from downloaded certificate
-            miss_matches = await self._verify_with_cross_check_text(
-                structured_output, cross_check_extraction
-            )
             if miss_matches:
                 self.verdict = Verdict(
                     decision=VerificationDecision.REJECT,
@@ -151,10 +210,13 @@ class CitiCertVerificationService:
         finally:
             # Save verification result
             if submission_data["submission"].id:
-                await self._save_verification_result(
-                    submission_data["submission"], self.verdict
+                await asyncio.to_thread(
+                    self._save_verification_result,
+                    submission_data["submission"],
+                    self.verdict,
                 )
-                await self._update_dashboard_stats(
+                await asyncio.to_thread(
+                    self._update_dashboard_stats,
                     submission_data["submission"].requirement_schedule_id,
                     self.verdict.decision,
                 )
@@ -170,6 +232,10 @@ class CitiCertVerificationService:
 
     async def _get_submission_data(self, submission_id: str) -> Dict[str, Any]:
         """Retrieve certificate submission with related data."""
+        return await asyncio.to_thread(self._get_submission_data_sync, submission_id)
+
+    def _get_submission_data_sync(self, submission_id: str) -> Dict[str, Any]:
+        """Blocking lookup for `_get_submission_data`, run in a worker thread."""
         try:
             with next(get_sync_session()) as db_session:
                 row = db_session.execute(
@@ -177,6 +243,16 @@ class CitiCertVerificationService:
                     .join(Student, CertificateSubmission.student_id == Student.id)
                     .join(User, Student.user_id == User.id)
                     .where(CertificateSubmission.id == submission_id)
+                    .options(
+                        load_only(
+                            CertificateSubmission.id,
+                            CertificateSubmission.filename,
+                            CertificateSubmission.file_object_name,
+                            CertificateSubmission.requirement_schedule_id,
+                        ),
+                        load_only(Student.id, Student.user_id),
+                        load_only(User.id, User.first_name, User.last_name),
+                    )
                 ).first()
 
                 if not row:
@@ -226,9 +302,7 @@ class CitiCertVerificationService:
                 return None
 
             try:
-                creation_date = await self._format_pdf_date(
-                    doc_metadata.creation_date or ""
-                )
+                creation_date = self._format_pdf_date(doc_metadata.creation_date or "")
                 if creation_date != structured_output.generated_on:
                     return None
             except ValueError as e:
@@ -240,13 +314,12 @@ class CitiCertVerificationService:
             ):
                 return None
 
-            valid_url_pattern = re.compile(
-                r"^(?:https:\\)?www\.citiprogram\.org/verify/\?w(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})-(\d{8})$",
-                re.IGNORECASE,
-            )
-
-            groups = valid_url_pattern.search(structured_output.verification_url)
-            if not groups or groups.group(1) != structured_output.record_id:
+            groups = _VERIFY_URL_RE.search(structured_output.verification_url)
+            if (
+                not groups
+                or not _is_uuid(groups.group(1))
+                or groups.group(2) != structured_output.record_id
+            ):
                 return None
 
             return structured_output
@@ -254,6 +327,20 @@ class CitiCertVerificationService:
             logger.error(str(e))
             raise e
 
+    async def _extract_and_cross_check(
+        self,
+        structured_output: CitiCertificateStructuredOutput,
+        filename: str,
+        certificate_data: bytes,
+    ) -> List[str]:
+        """Extract text from the downloaded certificate and cross-check it."""
+        cross_check_extraction = await self._extract_document_text(
+            filename, certificate_data
+        )
+        return await self._verify_with_cross_check_text(
+            structured_output, cross_check_extraction
+        )
+
     async def _verify_with_cross_check_text(
         self,
         structured_output: CitiCertificateStructuredOutput,
@@ -288,30 +375,39 @@ class CitiCertVerificationService:
                 # thus we need to clean those up
 
                 return (
-                    re.sub(r"\(.*?\)", "", str(val)).replace(" ", "").lower()
+                    _PARENS_RE.sub("", str(val)).translate(_SPACE_TBL).lower()
                     if val
                     else ""
                 )
 
-            fields = [
-                f for f in structured_output.model_dump().keys() if f != "generated_on"
-            ]
-
             return [
                 " ".join(field.split("_")).title()
-                for field in fields
-                if clean(getattr(structured_output, field))
-                != clean(getattr(cross_check_output, field))
+                for field, submitted, cross_checked in zip(
+                    _CROSS_CHECK_FIELDS,
+                    _get_cross_check_values(structured_output),
+                    _get_cross_check_values(cross_check_output),
+                )
+                if clean(submitted) != clean(cross_checked)
             ]
         except Exception as e:
             raise e
 
-    async def _format_pdf_date(self, date_str: str) -> str:
+    def _format_pdf_date(self, date_str: str) -> str:
         # Convert D:20250114031902-05'00' to 14-Jan-2025
-        dt = datetime.strptime(date_str.replace("D:", "")[:8], "%Y%m%d")
-        return dt.strftime("%d-%b-%Y")
-
-    async def _save_verification_result(
+        s = date_str.removeprefix("D:")[:8]
+        if len(s) != 8 or not s.isdigit():
+            raise ValueError(f"Invalid PDF date: {date_str}")
+        year, month, day = int(s[0:4]), int(s[4:6]), int(s[6:8])
+        # Reject the same impossible dates strptime("%Y%m%d") used to
+        if not (
+            year >= 1
+            and 1 <= month <= 12
+            and 1 <= day <= calendar.monthrange(year, month)[1]
+        ):
+            raise ValueError(f"Invalid PDF date: {date_str}")
+        return f"{s[6:8]}-{_MONTHS[month - 1]}-{s[0:4]}"
+
+    def _save_verification_result(
         self, submission: CertificateSubmission, verdict: Verdict
     ) -> None:
         """Save verification results to the database."""
@@ -320,8 +416,11 @@ class CitiCertVerificationService:
                 status = self.decision_mapping[verdict.decision]
 
                 # Update submission record
-                submission = db_session.get_one(CertificateSubmission, submission.id)
-                submission.submission_status = status
+                db_session.execute(
+                    update(CertificateSubmission)
+                    .where(CertificateSubmission.id == submission.id)
+                    .values(submission_status=status)
+                )
 
                 # Create verification history
                 verification_history = VerificationHistory(
@@ -337,7 +436,7 @@ class CitiCertVerificationService:
         except Exception as e:
             raise e
 
-    async def _update_dashboard_stats(
+    def _update_dashboard_stats(
         self, schedule_id: str, decision: VerificationDecision
     ) -> None:
         """Update dashboard statistics based on the validation decision."""
@@ -350,7 +449,7 @@ class CitiCertVerificationService:
                 1 if decision == VerificationDecision.APPROVE else 0
             )
 
-            await dashboard_stats_service.update_dashboard_stats_by_schedule(
+            dashboard_stats_service.update_dashboard_stats_by_schedule(
                 requirement_schedule_id=schedule_id,
                 agent_verification_increment=agent_verification_increment,
             )
@@ -402,97 +501,162 @@ def get_citi_verification_service() -> CitiCertVerificationService:
     return CitiCertVerificationService()
 
 
-async def download_certificate_from_url(url: str) -> bytes:
-    """Download certificate from CITI Program URL using Playwright automation."""
-    if not all([settings.CITI_USERNAME, settings.CITI_PASSWORD]):
-        raise Exception("CITI credentials not configured")
+class CitiBrowserPool:
+    """
+    Keeps one Chromium browser and a logged-in CITI context alive so that
+    consecutive certificate downloads skip the browser launch and login flow.
+    """
+
+    def __init__(self):
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._context: BrowserContext | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_context(self, url: str) -> BrowserContext:
+        """Return the shared context, launching the browser and logging in on first use."""
+        async with self._lock:
+            if (
+                self._context is not None
+                and not cast(Browser, self._browser).is_connected()
+            ):
+                # Chromium has gone away, taking the cached context with it
+                self._context = None
+
+            if self._context is None:
+                if self._browser is None or not self._browser.is_connected():
+                    await self._launch()
+
+                context = await cast(Browser, self._browser).new_context(
+                    accept_downloads=True,
+                    user_agent=_CITI_USER_AGENT,
+                )
+                try:
+                    await _login_to_citi(context, url)
+                except Exception:
+                    await context.close()
+                    raise
+                self._context = context
+
+            return self._context
+
+    async def invalidate(self) -> None:
+        """Drop the cached context so the next download logs in again."""
+        async with self._lock:
+            await self._close_context()
+
+    async def close(self) -> None:
+        """Close the context, browser and Playwright driver."""
+        async with self._lock:
+            await self._close_context()
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _launch(self) -> None:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=settings.CITI_HEADLESS,
+            timeout=settings.CITI_TIMEOUT,
+            args=["--no-sandbox", "--disable-dev-shm-usage"],
+        )
+
+    async def _close_context(self) -> None:
+        if self._context is None:
+            return
+        try:
+            await self._context.close()
+        except PlaywrightError as e:
+            logger.warning(f"Failed to close CITI browser context: {str(e)}")
+        finally:
+            self._context = None
+
+
+citi_browser_pool = CitiBrowserPool()
+
 
+async def _login_to_citi(context: BrowserContext, url: str) -> None:
+    """Log in to CITI Program through the link on the verification page."""
+    page = await context.new_page()
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=settings.CITI_HEADLESS,
-                timeout=settings.CITI_TIMEOUT,
-                args=["--no-sandbox", "--disable-dev-shm-usage"],
-            )
+        await page.goto(url, timeout=settings.CITI_TIMEOUT)
+        await page.wait_for_load_state("networkidle")
+
+        async with context.expect_page() as new_page_info:
+            await page.get_by_role(
+                "link",
+                name=re.compile("log in for easier access.", re.IGNORECASE),
+            ).click()
+
+        login_page = await new_page_info.value
+        await login_page.wait_for_load_state("networkidle")
+        await login_page.fill("#main-login-username", settings.CITI_USERNAME)
+        await login_page.fill("#main-login-password", settings.CITI_PASSWORD)
+        await login_page.click('input[type="submit"][value="Log In"]')
+        await login_page.wait_for_load_state("networkidle")
+        await login_page.close()
+    finally:
+        await page.close()
+
+
+async def _fetch_certificate_pdf(context: BrowserContext, url: str) -> bytes:
+    """Fetch the certificate PDF directly using the logged-in context's cookies."""
+    cookies = Cookies()
+    for cookie in await context.cookies():
+        cookies.set(
+            cookie.get("name", ""),
+            cookie.get("value", ""),
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
 
-            context = await browser.new_context(
-                accept_downloads=True,
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            )
+    async with AsyncClient(
+        cookies=cookies,
+        headers={"User-Agent": _CITI_USER_AGENT},
+        follow_redirects=True,
+        timeout=settings.CITI_TIMEOUT / 1000,
+    ) as client:
+        response = await client.get(url)
+        response.raise_for_status()
 
-            certificate_data: bytes = b""
+    logger.info(f"PDF captured ({len(response.content)} bytes)")
+    return response.content
 
-            try:
-                # Navigate and login
-                page = await context.new_page()
-                await page.goto(url, timeout=settings.CITI_TIMEOUT)
-                await page.wait_for_load_state("networkidle")
-
-                # Handle login
-                async with page.context.expect_page() as new_page_info:
-                    await page.get_by_role(
-                        "link",
-                        name=re.compile("log in for easier access.", re.IGNORECASE),
-                    ).click()
-
-                login_page = await new_page_info.value
-                await login_page.wait_for_load_state("networkidle")
-                await login_page.fill("#main-login-username", settings.CITI_USERNAME)
-                await login_page.fill("#main-login-password", settings.CITI_PASSWORD)
-                await login_page.click('input[type="submit"][value="Log In"]')
-
-                # Capture PDF
-                pdf_page = await context.new_page()
-
-                async def handle_pdf_requests(route):
-                    nonlocal certificate_data
-                    response = await route.fetch()
-                    certificate_data = await response.body()
-                    logger.info(f"PDF captured ({len(certificate_data)} bytes)")
-                    await route.abort()
-
-                await pdf_page.route(
-                    "https://www.citiprogram.org/verify/?*", handle_pdf_requests
-                )
 
-                """
-                        Navigating to a URL which triggers the download from the start, using page.got(), will throw a Playwright navigation error. This is an expected behavior in headless mode. The page.goto() function is to navigate to a URL and wait for the resource to load (like loading the content in a new tab). Normally, in a headed browser, this would work fine as the Chromium borwser open a new tab and embed the captured PDF into the embedded PDF viewer. However, in headless Chromium or Firefox (both headed and headless), the navigation will not happend as the PDF content is directly downloaded. This throws the following error:
-                            if (browserName === 'chromium') {
-                                expect(responseOrError instanceof Error).toBeTruthy();
-                                expect(responseOrError.message).toContain('net::ERR_ABORTED');
-                                expect(page.url()).toBe('about:blank');
-                            } else if (browserName === 'webkit') {
-                                expect(responseOrError instanceof Error).toBeTruthy();
-                                expect(responseOrError.message).toContain('Download is starting');
-                                expect(page.url()).toBe('about:blank');
-                            } else {
-                                expect(responseOrError instanceof Error).toBeTruthy();
-                                expect(responseOrError.message).toContain('Download is starting');
-                            }
-                        
-                        Playwright Docs:
-                        https://playwright.dev/python/docs/network#glob-url-patterns
-
-                        Issue References:
-                        https://github.com/microsoft/playwright/issues/18430
-                        https://issues.chromium.org/issues/41342415
-                        https://github.com/microsoft/playwright/issues/7822
-                        https://github.com/microsoft/playwright/issues/3509#issuecomment-675441299
-                    """
-                try:
-                    await pdf_page.goto(url, timeout=settings.CITI_TIMEOUT)
-                except PlaywrightError:
-                    logger.warning(
-                        "Request aborted - this may be expected behavior in headless mode"
-                    )
+def _is_stale_session_error(error: Exception) -> bool:
+    """Whether a failed fetch is likely to succeed after logging in again."""
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code in (401, 403)
+    # Playwright only fails here on a dead context, e.g. after a browser crash
+    return isinstance(error, PlaywrightError)
 
-            except PlaywrightError as e:
-                raise e
-            finally:
-                await context.close()
-                await browser.close()
 
-            return certificate_data
+async def download_certificate_from_url(url: str) -> bytes:
+    """Download certificate from CITI Program URL using a Playwright-authenticated session."""
+    if not all([settings.CITI_USERNAME, settings.CITI_PASSWORD]):
+        raise Exception("CITI credentials not configured")
 
-    except Exception as e:
-        raise e
+    certificate_data: bytes = b""
+    for attempt in range(2):
+        context = await citi_browser_pool.get_context(url)
+        try:
+            certificate_data = await _fetch_certificate_pdf(context, url)
+        except (PlaywrightError, HTTPError) as e:
+            await citi_browser_pool.invalidate()
+            if attempt or not _is_stale_session_error(e):
+                raise
+            logger.warning(f"CITI session unusable, logging in again: {str(e)}")
+            continue
+
+        if certificate_data.startswith(b"%PDF") or attempt:
+            break
+
+        # Anything other than a PDF means the cached session has expired
+        logger.warning("CITI session expired, logging in again")
+        await citi_browser_pool.invalidate()
+
+    return certificate_data
@@ -1,28 +1,144 @@
+import os
 import re
+import asyncio
 import pymupdf
 import pytesseract
 from PIL import Image
-from io import BytesIO
-from pathlib import Path
-from typing import Dict, Any, cast
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Tuple
 
 
 from app.config.settings import settings
 from app.schemas.citi_cert_schemas import DocExtractionResult, PyMuPDFMetadata
 
+SUPPORTED_EXTENSIONS: frozenset[str] = frozenset({"pdf"})
+TESSERACT_CONFIG = r"--oem 1 --psm 3"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Tesseract runs as a subprocess, so threads are enough to OCR pages in
+# parallel. Unlike a process pool, this also works inside Celery's prefork
+# workers, which are daemonic and cannot start children of their own.
+_OCR_WORKERS = min(os.cpu_count() or 1, 4)
+# CITI certificates are one or two pages; later pages of a scan are not OCRed
+_OCR_MAX_PAGES = 5
+
+
+@lru_cache(maxsize=1)
+def _get_ocr_pool() -> ThreadPoolExecutor:
+    """Thread pool for concurrent Tesseract calls, created lazily in each process."""
+    pytesseract.pytesseract.tesseract_cmd = settings.TESSERACT_CMD
+    # Pages are already OCRed in parallel, so keep each Tesseract process
+    # single-threaded to avoid oversubscribing the cores
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    return ThreadPoolExecutor(max_workers=_OCR_WORKERS, thread_name_prefix="ocr")
+
+
+def _read_pdf_text(pdf_data: bytes) -> Tuple[int, Dict[str, Any], List[str]]:
+    """
+    Read the text layer of every page.
+
+    Returns:
+        Page count, document metadata and the non-empty page texts
+    """
+    doc = pymupdf.open(stream=pdf_data, filetype="pdf")
+    try:
+        page_count = len(doc)
+        load_page = doc.load_page
+        all_text = [
+            text
+            for page_num in range(page_count)
+            if (text := load_page(page_num).get_textpage().extractTEXT().strip())
+        ]
+
+        return page_count, dict(doc.metadata or {}), all_text
+    finally:
+        doc.close()
+
+
+def _ocr_pdf(
+    file_data: bytes, tesseract_config: str
+) -> Tuple[int, Dict[str, Any], List[Tuple[List[str], float]]]:
+    """
+    Render the leading pages of a PDF and OCR them concurrently.
+
+    The document is opened once and rendered page by page in the calling
+    thread, as PyMuPDF is not thread-safe; only the Tesseract calls are
+    handed to the OCR pool. The next page is rendered only once a worker
+    is free, so at most _OCR_WORKERS full-resolution images are held.
+
+    Returns:
+        Number of pages OCRed, document metadata and, per page, the
+        confidently recognized words with the sum of their confidence scores
+    """
+    pool = _get_ocr_pool()
+    doc = pymupdf.open(stream=file_data, filetype="pdf")
+    try:
+        page_count = min(len(doc), _OCR_MAX_PAGES)
+        metadata = dict(doc.metadata or {})
+
+        futures: List[Future[Tuple[List[str], float]]] = []
+        for page_num in range(page_count):
+            pending = [future for future in futures if not future.done()]
+            if len(pending) >= _OCR_WORKERS:
+                wait(pending, return_when=FIRST_COMPLETED)
+
+            image = _render_page(doc.load_page(page_num))
+            futures.append(pool.submit(_ocr_page, image, tesseract_config))
+            image = None  # Free memory once the worker is done with it
+    finally:
+        doc.close()
+
+    return page_count, metadata, [future.result() for future in futures]
+
+
+def _render_page(pdf_page: pymupdf.Page) -> Image.Image:
+    """Render a PDF page at 300 DPI as an RGB image."""
+    pixmap = pdf_page.get_pixmap(dpi=300)  # type: ignore
+    pixmap = pymupdf.Pixmap(pixmap, 0) if pixmap.alpha else pixmap
+
+    # Wrap the raw RGB samples directly rather than round-tripping through PNG
+    return Image.frombuffer(
+        "RGB",
+        (pixmap.width, pixmap.height),
+        pixmap.samples,
+        "raw",
+        "RGB",
+        pixmap.stride,
+        1,
+    )
+
+
+def _ocr_page(image: Image.Image, tesseract_config: str) -> Tuple[List[str], float]:
+    """OCR one rendered page, keeping only confidently recognized words."""
+    data = pytesseract.image_to_data(
+        image,
+        output_type=pytesseract.Output.DICT,
+        config=tesseract_config,
+    )
+    words: List[str] = []
+    total_confidence = 0.0
+    for word, conf in zip(data["text"], data["conf"]):
+        conf = float(conf)
+        if conf > 70:
+            words.append(str(word).strip())
+            total_confidence += conf
+
+    return words, total_confidence
+
 
 class DocumentService:
     """Service for extracting text and metadata from submitted documents. Currently supports only PDF files."""
 
-    def __init__(self):
-        self.supported_extensions = {"pdf"}
-        self.tesseract_config = r"--oem 1 --psm 3"
+    supported_extensions = SUPPORTED_EXTENSIONS
+    tesseract_config = TESSERACT_CONFIG
 
     async def extract_text(
         self, file_content: bytes, filename: str
     ) -> DocExtractionResult:
         """Extract text from file content asynchronously."""
-        file_extension = Path(filename).suffix.lower().lstrip(".")
+        file_extension = filename.rpartition(".")[2].lower() if "." in filename else ""
 
         try:
             if file_extension not in self.supported_extensions:
@@ -41,36 +157,26 @@ class DocumentService:
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize the OCR text."""
-        # Remove extra whitespace and normalize line breaks
-        text = re.sub(r"\s+", " ", text)
-        text = re.sub(r"\n+", "\n", text)
-        return text.strip()
+        # Collapse all whitespace, line breaks included, into single spaces
+        return _WHITESPACE_RE.sub(" ", text).strip()
 
     async def _extract_with_pymupdf(self, pdf_data: bytes) -> DocExtractionResult:
         """Extract text using PyMuPDF from digital PDFs."""
 
         try:
-            doc = pymupdf.open(stream=pdf_data, filetype="pdf")
-            metadata = PyMuPDFMetadata(**cast(Dict[str, Any], doc.metadata))
-            all_text = []
-            page_count = len(doc)
-
-            for page_num in range(page_count):
-                page = doc.load_page(page_num)
-                text = page.get_textpage().extractTEXT()
-                if text.strip():
-                    all_text.append(text.strip())
+            # Parsing is CPU-bound, so keep it off the event loop
+            page_count, metadata, all_text = await asyncio.to_thread(
+                _read_pdf_text, pdf_data
+            )
 
-            full_text = "\n\n".join(all_text)
-            full_text = self._clean_text(full_text)
-            doc.close()
+            full_text = self._clean_text("\n\n".join(all_text))
 
             return DocExtractionResult(
                 method="pymupdf",
                 pages=page_count,
                 text=full_text,
                 confidence=99.00 if full_text.strip() else 0.00,
-                metadata=metadata,
+                metadata=PyMuPDFMetadata(**metadata),
             )
 
         except Exception as e:
@@ -80,42 +186,31 @@ class DocumentService:
         """Extract text using Tesseract OCR from scanned PDFs."""
 
         try:
-            pytesseract.pytesseract.tesseract_cmd = settings.TESSERACT_CMD
-
-            doc = pymupdf.open(stream=file_data, filetype="pdf")
-            metadata = PyMuPDFMetadata(**cast(Dict[str, Any], doc.metadata))
-            pdf_page = doc.load_page(0)
-            pixmap = pdf_page.get_pixmap(dpi=300)  # type: ignore
-            pixmap = pymupdf.Pixmap(pixmap, 0) if pixmap.alpha else pixmap
-
-            img_data = pixmap.pil_tobytes(format="png")
-            pil_img_data = Image.open(BytesIO(img_data))
-            doc.close()
-            pdf_page = None  # Free memory
-            pixmap = None  # Free memory
-
-            # Get OCR results as a DataFrame
-            df = pytesseract.image_to_data(
-                pil_img_data,
-                output_type=pytesseract.Output.DATAFRAME,
-                config=self.tesseract_config,
+            # Rendering and OCR are CPU-bound, so keep them off the event loop
+            page_count, metadata, pages = await asyncio.to_thread(
+                _ocr_pdf, file_data, self.tesseract_config
             )
-            df = df.loc[df["conf"] > 70, ["text", "conf"]]
-            text = " ".join(df["text"].fillna("").str.strip())
-            confidence = df["conf"].mean()
+
+            page_words = [words for words, _ in pages]
+            total_confidence = sum(confidence for _, confidence in pages)
+            word_count = sum(len(words) for words in page_words)
+            text = "\n\n".join(" ".join(words) for words in page_words)
 
             return DocExtractionResult(
                 method="tesseract",
-                pages=1,
+                pages=page_count,
                 text=self._clean_text(text),
-                confidence=float(confidence.round(2)),
-                metadata=metadata,
+                confidence=(
+                    round(total_confidence / word_count, 2) if word_count else 0.0
+                ),
+                metadata=PyMuPDFMetadata(**metadata),
             )
 
         except Exception as e:
             raise Exception(str(e))
 
 
+@lru_cache(maxsize=1)
 def get_document_service() -> DocumentService:
-    """Dependency to get Document service instance."""
+    """Dependency to get the shared Document service instance."""
     return DocumentService()
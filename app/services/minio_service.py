@@ -1,5 +1,6 @@
 import asyncio
 from datetime import timedelta
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from uuid import uuid4
 
@@ -400,6 +401,7 @@ class MinIOService:
             )
 
 
+@lru_cache(maxsize=1)
 def get_minio_service() -> MinIOService:
-    """Dependency to get MinIO service instance"""
+    """Dependency to get the shared MinIO service instance"""
     return MinIOService()
@@ -2,7 +2,7 @@ import uuid
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import case, func, select, update
 
 from app.db.models import (
     DashboardStats,
@@ -11,6 +11,8 @@ from app.db.models import (
     Program,
     AcademicYear,
     CertificateSubmission,
+    SubmissionStatus,
+    SubmissionTiming,
 )
 from app.db.session import get_sync_session
 from app.schemas.staff.dashboard_stats_schemas import DashboardStatsResponse
@@ -20,6 +22,36 @@ from app.utils.datetime_utils import naive_utc_now
 
 logger = get_logger()
 
+# DashboardStats column for each enum member, built once at import
+_STATUS_KEY = {m: f"{m.value.lower()}_count" for m in SubmissionStatus}
+_TIMING_KEY = {m: f"{m.value.lower()}_submissions" for m in SubmissionTiming}
+_COUNT_KEYS = ("submitted_count", *_STATUS_KEY.values(), *_TIMING_KEY.values())
+assert set(_COUNT_KEYS) <= set(
+    DashboardStats.__table__.c.keys()
+), "Every SubmissionStatus/SubmissionTiming member needs a DashboardStats column"
+
+
+def _count_where(condition):
+    """Count rows matching a condition; portable to SQL Server, which lacks FILTER."""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _schedule_submission_count(aggregate):
+    """
+    Aggregate the submissions of the dashboard row being updated.
+
+    The subquery correlates to the UPDATE target, so it can be used directly
+    as a SET value without adding a second table to the statement.
+    """
+    return (
+        select(aggregate)
+        .where(
+            CertificateSubmission.requirement_schedule_id
+            == DashboardStats.requirement_schedule_id
+        )
+        .scalar_subquery()
+    )
+
 
 class DashboardStatsService:
     """Service for managing dashboard statistics."""
@@ -28,7 +60,7 @@ class DashboardStatsService:
         self.db = db_session
         self.student_service = get_student_service(db_session)
 
-    async def update_dashboard_stats_by_schedule(
+    def update_dashboard_stats_by_schedule(
         self,
         requirement_schedule_id: str,
         agent_verification_increment: int = 0,
@@ -47,24 +79,45 @@ class DashboardStatsService:
             ValueError: If no dashboard stats record is found for the schedule
         """
 
-        submissions = (
-            self.db.execute(
-                select(
-                    CertificateSubmission.submission_status,
-                    CertificateSubmission.submission_timing,
-                ).where(
-                    CertificateSubmission.requirement_schedule_id
-                    == requirement_schedule_id
-                )
-            )
-        ).all()
-
-        dashboard_stats = (
-            self.db.execute(
-                select(DashboardStats).where(
-                    DashboardStats.requirement_schedule_id == requirement_schedule_id
-                )
+        submission = CertificateSubmission
+        submitted_count = _schedule_submission_count(func.count())
+        counts = {
+            **{
+                key: _count_where(submission.submission_status == member)
+                for member, key in _STATUS_KEY.items()
+            },
+            **{
+                key: _count_where(submission.submission_timing == member)
+                for member, key in _TIMING_KEY.items()
+            },
+        }
+
+        # Recount, write and fetch the row back in a single UPDATE ... RETURNING
+        # round trip; increments are applied server-side so concurrent
+        # verifications don't overwrite each other's deltas
+        dashboard_stats = self.db.execute(
+            update(DashboardStats)
+            .where(DashboardStats.requirement_schedule_id == requirement_schedule_id)
+            .values(
+                submitted_count=submitted_count,
+                **{
+                    key: _schedule_submission_count(aggregate)
+                    for key, aggregate in counts.items()
+                },
+                not_submitted_count=(
+                    DashboardStats.total_submissions_required - submitted_count
+                ),
+                agent_verification_count=(
+                    DashboardStats.agent_verification_count
+                    + agent_verification_increment
+                ),
+                manual_verification_count=(
+                    DashboardStats.manual_verification_count
+                    + manual_verification_increment
+                ),
+                last_calculated_at=naive_utc_now(),
             )
+            .returning(DashboardStats)
         ).scalar_one_or_none()
 
         if not dashboard_stats:
@@ -72,31 +125,7 @@ class DashboardStatsService:
                 f"Dashboard stats for schedule {requirement_schedule_id} not found"
             )
 
-        stats: dict[str, int] = {}
-        for submission in submissions:
-            status, timing = submission
-            status_key = f"{status.value.lower()}_count"
-            timing_key = f"{timing.value.lower()}_submissions"
-            stats[status_key] = stats.get(status_key, 0) + 1
-            stats[timing_key] = stats.get(timing_key, 0) + 1
-
-        dashboard_stats.submitted_count = len(submissions)
-        dashboard_stats.approved_count = stats.get("approved_count", 0)
-        dashboard_stats.rejected_count = stats.get("rejected_count", 0)
-        dashboard_stats.pending_count = stats.get("pending_count", 0)
-        dashboard_stats.manual_review_count = stats.get("manual_review_count", 0)
-        dashboard_stats.on_time_submissions = stats.get("on_time_submissions", 0)
-        dashboard_stats.late_submissions = stats.get("late_submissions", 0)
-        dashboard_stats.overdue_submissions = stats.get("overdue_submissions", 0)
-        dashboard_stats.not_submitted_count = (
-            dashboard_stats.total_submissions_required - len(submissions)
-        )
-        dashboard_stats.agent_verification_count += agent_verification_increment
-        dashboard_stats.manual_verification_count += manual_verification_increment
-        dashboard_stats.last_calculated_at = naive_utc_now()
-
         self.db.commit()
-        self.db.refresh(dashboard_stats)
 
         logger.info(
             f"Recalculated dashboard stats for schedule {requirement_schedule_id}"
@@ -131,30 +160,7 @@ class DashboardStatsService:
                 f"Dashboard stats for schedule {requirement_schedule_id} not found"
             )
 
-        dashboard_stats_response = DashboardStatsResponse(
-            id=str(dashboard_stats.id),
-            requirement_schedule_id=str(dashboard_stats.requirement_schedule_id),
-            program_id=str(dashboard_stats.program_id),
-            academic_year_id=str(dashboard_stats.academic_year_id),
-            cert_type_id=str(dashboard_stats.cert_type_id),
-            total_submissions_required=dashboard_stats.total_submissions_required,
-            submitted_count=dashboard_stats.submitted_count,
-            approved_count=dashboard_stats.approved_count,
-            rejected_count=dashboard_stats.rejected_count,
-            pending_count=dashboard_stats.pending_count,
-            manual_review_count=dashboard_stats.manual_review_count,
-            not_submitted_count=dashboard_stats.not_submitted_count,
-            on_time_submissions=dashboard_stats.on_time_submissions,
-            late_submissions=dashboard_stats.late_submissions,
-            overdue_submissions=dashboard_stats.overdue_submissions,
-            manual_verification_count=dashboard_stats.manual_verification_count,
-            agent_verification_count=dashboard_stats.agent_verification_count,
-            last_calculated_at=dashboard_stats.last_calculated_at,
-            created_at=dashboard_stats.created_at,
-            updated_at=dashboard_stats.updated_at,
-        )
-
-        return dashboard_stats_response
+        return DashboardStatsResponse.model_validate(dashboard_stats)
 
     async def create_dashboard_stats_by_schedule_id(
         self, schedule_id: str
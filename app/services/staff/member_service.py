@@ -1,7 +1,7 @@
 import uuid
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update
 from typing import List
 
 
@@ -24,23 +24,19 @@ class MemberService:
     async def get_all_members_with_count(self) -> List[StaffMemberItem]:
         try:
             rows = self.db_session.execute(
-                select(Staff, User).join(User, Staff.user_id == User.id)
+                select(
+                    Staff.id,
+                    User.username,
+                    User.first_name,
+                    User.last_name,
+                    User.is_active,
+                    User.created_at,
+                    User.updated_at,
+                ).join(User, Staff.user_id == User.id)
             ).all()
-            members: List[StaffMemberItem] = []
-            for row in rows:
-                staff: Staff = row[0]
-                user: User = row[1]
-                member_item = StaffMemberItem(
-                    id=staff.id,
-                    username=user.username,
-                    first_name=user.first_name,
-                    last_name=user.last_name,
-                    is_active=user.is_active,
-                    created_at=user.created_at,
-                    updated_at=user.updated_at,
-                )
-                members.append(member_item)
-            return members
+
+            # Rows come straight from the database, so skip re-validation
+            return [StaffMemberItem.model_construct(**row._mapping) for row in rows]
         except Exception as e:
             logger.error(str(e))
             raise e
@@ -56,8 +52,9 @@ class MemberService:
             if row:
                 raise ValueError("Staff member with this username already exists")
 
-            # Create staff user and staff record
-            user_id = str(uuid.uuid4())
+            # Create staff user and staff record; StringUUID binds uuid.UUID as-is
+            user_id = uuid.uuid4()
+            staff_id = uuid.uuid4()
 
             # Create user
             user = User(
@@ -71,7 +68,7 @@ class MemberService:
 
             # Create staff
             staff = Staff(
-                id=str(uuid.uuid4()),
+                id=staff_id,
                 user_id=user_id,
             )
 
@@ -80,7 +77,7 @@ class MemberService:
             self.db_session.commit()
 
             return StaffMemberItem(
-                id=staff.id,
+                id=str(staff_id),
                 username=user.username,
                 first_name=user.first_name,
                 last_name=user.last_name,
@@ -97,29 +94,36 @@ class MemberService:
         self, staff_id: str, member_data: UpdateStaffMemberRequest
     ) -> StaffMemberItem:
         try:
-            row = self.db_session.get_one(Staff, staff_id)
-            if not row:
+            staff = self.db_session.execute(
+                select(Staff.id, Staff.user_id).where(Staff.id == staff_id)
+            ).one_or_none()
+            if not staff:
                 raise ValueError("Staff member not found")
 
-            user = self.db_session.get_one(User, row.user_id)
-            if not user:
+            # Update user fields and read back the response columns in one statement
+            row = self.db_session.execute(
+                update(User)
+                .where(User.id == staff.user_id)
+                .values(
+                    first_name=member_data.first_name,
+                    last_name=member_data.last_name,
+                    # is_active=member_data.is_active,
+                )
+                .returning(
+                    User.username,
+                    User.first_name,
+                    User.last_name,
+                    User.is_active,
+                    User.created_at,
+                    User.updated_at,
+                )
+            ).one_or_none()
+            if not row:
                 raise ValueError("Associated user not found")
 
-            # Update user fields
-            user.first_name = member_data.first_name
-            user.last_name = member_data.last_name
-            # user.is_active = member_data.is_active
             self.db_session.commit()
 
-            return StaffMemberItem(
-                id=row.id,
-                username=user.username,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
+            return StaffMemberItem.model_construct(id=staff.id, **row._mapping)
         except Exception as e:
             logger.error(str(e))
             raise e
@@ -1,11 +1,20 @@
 import asyncio
 
+from celery.signals import worker_process_shutdown
+
 from app.celery import celery
-from app.services.citi_verification_service import get_citi_verification_service
+from app.services.citi_verification_service import (
+    citi_browser_pool,
+    get_citi_verification_service,
+)
 from app.utils.logging import get_logger
 
 logger = get_logger()
 
+# One event loop per worker process, so the shared CITI browser session
+# survives from one verification task to the next
+_runner = asyncio.Runner()
+
 
 @celery.task(bind=True, max_retries=3, default_retry_delay=60)
 def verify_certificate_task(self, request_id: str, submission_id: str):
@@ -16,7 +25,7 @@ def verify_certificate_task(self, request_id: str, submission_id: str):
         request_id: The request ID from the original HTTP request
         submission_id: UUID of the certificate submission to verify
     """
-    return asyncio.run(_async_verify_certificate(request_id, submission_id))
+    return _runner.run(_async_verify_certificate(request_id, submission_id))
 
 
 async def _async_verify_certificate(request_id: str, submission_id: str):
@@ -37,3 +46,12 @@ async def _async_verify_certificate(request_id: str, submission_id: str):
             f"Certificate verification task exception for {submission_id}: {str(e)}"
         )
         raise e
+
+
+@worker_process_shutdown.connect
+def _close_citi_browser_pool(**_):
+    """Close the shared CITI browser before the worker process exits."""
+    try:
+        _runner.run(citi_browser_pool.close())
+    finally:
+        _runner.close()
@@ -10,7 +10,6 @@ class CookieUtils:
         if not authorization_header:
             return None
 
-        if not authorization_header.startswith("Bearer "):
-            return None
-
-        return authorization_header[7:]  # Remove "Bearer " prefix
+        # removeprefix hands back the same object when the prefix is absent
+        token = authorization_header.removeprefix("Bearer ")
+        return token if token is not authorization_header else None
@@ -3,7 +3,8 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
-import traceback
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
 from .logging import get_logger
 from .responses import ResponseBuilder
 
@@ -50,9 +51,82 @@ class LineApplicationError(Exception):
         self.message = message
 
 
+# (exception type, log label, status code, response message) for the handlers
+# that only differ in these values
+_error_message: Callable[[Exception], str] = attrgetter("message")
+_ERROR_HANDLERS: Tuple[
+    Tuple[Type[Exception], str, int, Callable[[Exception], str]], ...
+] = (
+    (
+        BusinessLogicError,
+        "Business Logic Error",
+        status.HTTP_400_BAD_REQUEST,
+        _error_message,
+    ),
+    (
+        AuthenticationError,
+        "Authentication Error",
+        status.HTTP_401_UNAUTHORIZED,
+        _error_message,
+    ),
+    (
+        AuthorizationError,
+        "Authorization Error",
+        status.HTTP_403_FORBIDDEN,
+        _error_message,
+    ),
+    (NotFoundError, "Not Found Error", status.HTTP_404_NOT_FOUND, _error_message),
+    (
+        LineApplicationError,
+        "LINE Application Error",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        _error_message,
+    ),
+    (ValueError, "Value Error", status.HTTP_400_BAD_REQUEST, str),
+)
+
+
+def _format_errors(errors: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Format validation errors for better readability."""
+    if not errors:
+        return []
+
+    return [
+        {
+            "field": " -> ".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"],
+            "input": error.get("input"),
+        }
+        for error in errors
+    ]
+
+
+def _make_error_handler(
+    label: str, status_code: int, message_fn: Callable[[Exception], str]
+):
+    """Build an exception handler that logs the error and returns a fixed status."""
+
+    async def handler(request: Request, exc: Exception):
+        logger.error(f"{label}: {str(exc)}")
+
+        return ResponseBuilder.error(
+            request=request,
+            message=message_fn(exc),
+            status_code=status_code,
+        )
+
+    return handler
+
+
 def setup_error_handlers(app: FastAPI):
     """Setup custom error handlers."""
 
+    for exc_type, label, status_code, message_fn in _ERROR_HANDLERS:
+        app.add_exception_handler(
+            exc_type, _make_error_handler(label, status_code, message_fn)
+        )
+
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         logger.error(f"HTTP Exception: {str(exc)}")
@@ -70,25 +144,13 @@ def setup_error_handlers(app: FastAPI):
     async def request_validation_exception_handler(
         request: Request, exc: RequestValidationError
     ):
-        logger.error(f"Request Validation Error: {exc.errors()}")
-
-        # Format validation errors for better readability
-        formatted_errors = []
-        for error in exc.errors():
-            field_path = " -> ".join(str(loc) for loc in error["loc"])
-            formatted_errors.append(
-                {
-                    "field": field_path,
-                    "message": error["msg"],
-                    "type": error["type"],
-                    "input": error.get("input"),
-                }
-            )
+        errors = exc.errors()
+        logger.error(f"Request Validation Error: {errors}")
 
         return ResponseBuilder.error(
             request=request,
             message="Request validation failed",
-            errors=formatted_errors,
+            errors=_format_errors(errors),
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
@@ -102,19 +164,6 @@ def setup_error_handlers(app: FastAPI):
     ):
         logger.error(f"Pydantic Validation Error: {exc.errors()}")
 
-        # Format Pydantic validation errors
-        formatted_errors = []
-        for error in exc.errors():
-            field_path = " -> ".join(str(loc) for loc in error["loc"])
-            formatted_errors.append(
-                {
-                    "field": field_path,
-                    "message": error["msg"],
-                    "type": error["type"],
-                    "input": error.get("input"),
-                }
-            )
-
         return ResponseBuilder.error(
             request=request,
             message="Data validation failed",
@@ -123,7 +172,7 @@ def setup_error_handlers(app: FastAPI):
 
     @app.exception_handler(SQLAlchemyError)
     async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
-        logger.error(f"SQLAlchemy Error: {str(exc)}")
+        logger.opt(exception=exc).error("SQLAlchemy Error: {}", exc)
 
         # Don't expose internal database errors to users
         return ResponseBuilder.error(
@@ -132,74 +181,6 @@ def setup_error_handlers(app: FastAPI):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
-    @app.exception_handler(BusinessLogicError)
-    async def business_logic_exception_handler(
-        request: Request, exc: BusinessLogicError
-    ):
-        logger.error(f"Business Logic Error: {str(exc)}")
-
-        return ResponseBuilder.error(
-            request=request,
-            message=exc.message,
-            status_code=status.HTTP_400_BAD_REQUEST,
-        )
-
-    @app.exception_handler(AuthenticationError)
-    async def authentication_exception_handler(
-        request: Request, exc: AuthenticationError
-    ):
-        logger.error(f"Authentication Error: {str(exc)}")
-
-        return ResponseBuilder.error(
-            request=request,
-            message=exc.message,
-            status_code=status.HTTP_401_UNAUTHORIZED,
-        )
-
-    @app.exception_handler(AuthorizationError)
-    async def authorization_exception_handler(
-        request: Request, exc: AuthorizationError
-    ):
-        logger.error(f"Authorization Error: {str(exc)}")
-
-        return ResponseBuilder.error(
-            request=request,
-            message=exc.message,
-            status_code=status.HTTP_403_FORBIDDEN,
-        )
-
-    @app.exception_handler(NotFoundError)
-    async def not_found_exception_handler(request: Request, exc: NotFoundError):
-        logger.error(f"Not Found Error: {str(exc)}")
-
-        return ResponseBuilder.error(
-            request=request,
-            message=exc.message,
-            status_code=status.HTTP_404_NOT_FOUND,
-        )
-
-    @app.exception_handler(LineApplicationError)
-    async def line_application_exception_handler(
-        request: Request, exc: LineApplicationError
-    ):
-        logger.error(f"LINE Application Error: {str(exc)}")
-
-        return ResponseBuilder.error(
-            request=request,
-            message=exc.message,
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
-    @app.exception_handler(ValueError)
-    async def value_error_handler(request: Request, exc: ValueError):
-        logger.error(f"Value Error: {str(exc)}")
-
-        return ResponseBuilder.error(
-            request=request,
-            message=str(exc),
-            status_code=status.HTTP_400_BAD_REQUEST,
-        )
-
     @app.exception_handler(KeyError)
     async def key_error_handler(request: Request, exc: KeyError):
         logger.error(f"Key Error: {str(exc)}")
@@ -214,8 +195,7 @@ def setup_error_handlers(app: FastAPI):
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle all other unhandled exceptions"""
-        logger.error(f"Unhandled Exception: {str(exc)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.opt(exception=exc).error("Unhandled Exception: {}", exc)
 
         return ResponseBuilder.error(
             request=request,
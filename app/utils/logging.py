@@ -72,6 +72,7 @@ class CustomizeLogger:
             sys.stdout,
             enqueue=True,
             backtrace=True,
+            diagnose=False,
             level=level.upper(),
             format=console_format,
             colorize=True,
@@ -85,6 +86,7 @@ class CustomizeLogger:
                 retention=retention,
                 enqueue=True,
                 backtrace=True,
+                diagnose=False,
                 level=level.upper(),
                 serialize=True,
                 colorize=False,
@@ -96,6 +98,7 @@ class CustomizeLogger:
                 retention=retention,
                 enqueue=True,
                 backtrace=True,
+                diagnose=False,
                 level=level.upper(),
                 format=file_format,
                 colorize=False,
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 from fastapi import status, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.schemas.response_schemas import ApiResponse, PaginationMeta, ResponseStatus
 
 
@@ -15,7 +15,7 @@ class ResponseBuilder:
         meta: Optional[Dict[str, Any]] = None,
         pagination: Optional[PaginationMeta] = None,
         status_code: int = status.HTTP_200_OK,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Create a success response"""
         response = ApiResponse(
             success=True,
@@ -27,7 +27,7 @@ class ResponseBuilder:
             request_id=request.state.request_id,
             path=str(request.url.path),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content=response.model_dump(exclude_none=True),
         )
@@ -40,7 +40,7 @@ class ResponseBuilder:
         status_code: int = status.HTTP_400_BAD_REQUEST,
         data: Any = None,
         meta: Optional[Dict[str, Any]] = None,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Create an error response"""
         response_meta = meta or {}
 
@@ -54,7 +54,7 @@ class ResponseBuilder:
             request_id=request.state.request_id,
             path=str(request.url.path),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code, content=response.model_dump(exclude_none=True)
         )
 
@@ -66,7 +66,7 @@ class ResponseBuilder:
         warnings: Optional[List[str]] = None,
         meta: Optional[Dict[str, Any]] = None,
         status_code: int = status.HTTP_200_OK,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Create a warning response"""
         response = ApiResponse(
             success=True,
@@ -78,7 +78,7 @@ class ResponseBuilder:
             request_id=request.state.request_id,
             path=str(request.url.path),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code, content=response.model_dump(exclude_none=True)
         )
 
@@ -91,7 +91,7 @@ class ResponseBuilder:
         total: int,
         message: str = "Data retrieved successfully",
         meta: Optional[Dict[str, Any]] = None,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Create a paginated response"""
         total_pages = (total + per_page - 1) // per_page
         has_next = page < total_pages